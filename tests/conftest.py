@@ -0,0 +1,101 @@
+"""
+Shared fixtures for the Mergington High School Activities API tests
+"""
+
+import orjson
+import pytest
+from types import MappingProxyType
+
+from app import activities
+
+
+# Pristine activity data, read-only so the reset only needs to copy participants
+_ACTIVITIES_TEMPLATE = MappingProxyType({
+    "Drama Club": MappingProxyType({
+        "description": "Perform in theatrical productions and develop acting skills",
+        "schedule": "Wednesdays, 4:00 PM - 5:30 PM",
+        "max_participants": 25,
+        "participants": ("alex@mergington.edu",)
+    }),
+    "Art Studio": MappingProxyType({
+        "description": "Explore painting, drawing, and sculpture techniques",
+        "schedule": "Mondays and Thursdays, 3:30 PM - 5:00 PM",
+        "max_participants": 18,
+        "participants": ("isabella@mergington.edu",)
+    }),
+    "Debate Team": MappingProxyType({
+        "description": "Develop public speaking and argumentation skills",
+        "schedule": "Tuesdays, 3:30 PM - 4:45 PM",
+        "max_participants": 16,
+        "participants": ("james@mergington.edu",)
+    }),
+    "Robotics Club": MappingProxyType({
+        "description": "Design and build robots for competitions",
+        "schedule": "Wednesdays and Fridays, 4:00 PM - 5:30 PM",
+        "max_participants": 15,
+        "participants": ("sara@mergington.edu",)
+    }),
+    "Basketball Team": MappingProxyType({
+        "description": "Competitive basketball training and games",
+        "schedule": "Mondays and Thursdays, 4:00 PM - 5:30 PM",
+        "max_participants": 14,
+        "participants": ("marcus@mergington.edu", "jessica@mergington.edu")
+    }),
+    "Soccer Team": MappingProxyType({
+        "description": "Competitive soccer training and matches",
+        "schedule": "Tuesdays and Thursdays, 4:00 PM - 5:30 PM",
+        "max_participants": 16,
+        "participants": ("chris@mergington.edu",)
+    }),
+    "Chess Club": MappingProxyType({
+        "description": "Learn strategies and compete in chess tournaments",
+        "schedule": "Fridays, 3:30 PM - 5:00 PM",
+        "max_participants": 12,
+        "participants": ("michael@mergington.edu", "daniel@mergington.edu")
+    }),
+    "Programming Class": MappingProxyType({
+        "description": "Learn programming fundamentals and build software projects",
+        "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
+        "max_participants": 20,
+        "participants": ("emma@mergington.edu", "sophia@mergington.edu")
+    }),
+    "Gym Class": MappingProxyType({
+        "description": "Physical education and sports activities",
+        "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
+        "max_participants": 30,
+        "participants": ("john@mergington.edu", "olivia@mergington.edu")
+    })
+})
+
+
+def _restore_activities():
+    """Rebuild activities from the read-only template"""
+    # The template cannot be mutated, so only participants needs a fresh list
+    activities.clear()
+    activities.update({
+        name: {
+            "description": details["description"],
+            "schedule": details["schedule"],
+            "max_participants": details["max_participants"],
+            "participants": list(details["participants"])
+        }
+        for name, details in _ACTIVITIES_TEMPLATE.items()
+    })
+
+
+@pytest.fixture
+def reset_activities():
+    """Restore activities data after a test that changes it"""
+    # activities starts clean and every changing test restores it here, so
+    # each test, whether or not it uses this fixture, starts from clean data
+    yield
+    _restore_activities()
+
+
+@pytest.fixture(scope="session")
+def expected_activities_bytes():
+    """JSON bytes of the template data, serialized once per session"""
+    return orjson.dumps({
+        name: {**details, "participants": list(details["participants"])}
+        for name, details in _ACTIVITIES_TEMPLATE.items()
+    })
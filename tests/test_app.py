@@ -2,91 +2,32 @@
 Tests for the Mergington High School Activities API
 """
 
+import orjson
 import pytest
 from fastapi.testclient import TestClient
-import sys
-from pathlib import Path
-
-# Add src directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from app import app, activities
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client():
-    """Create a test client"""
-    return TestClient(app)
+    """Create a test client shared for the whole test session"""
+    with TestClient(app) as test_client:
+        yield test_client
 
 
-@pytest.fixture(autouse=True)
-def reset_activities():
-    """Reset activities data before each test"""
-    # Store original state
-    original_activities = {
-        "Drama Club": {
-            "description": "Perform in theatrical productions and develop acting skills",
-            "schedule": "Wednesdays, 4:00 PM - 5:30 PM",
-            "max_participants": 25,
-            "participants": ["alex@mergington.edu"]
-        },
-        "Art Studio": {
-            "description": "Explore painting, drawing, and sculpture techniques",
-            "schedule": "Mondays and Thursdays, 3:30 PM - 5:00 PM",
-            "max_participants": 18,
-            "participants": ["isabella@mergington.edu"]
-        },
-        "Debate Team": {
-            "description": "Develop public speaking and argumentation skills",
-            "schedule": "Tuesdays, 3:30 PM - 4:45 PM",
-            "max_participants": 16,
-            "participants": ["james@mergington.edu"]
-        },
-        "Robotics Club": {
-            "description": "Design and build robots for competitions",
-            "schedule": "Wednesdays and Fridays, 4:00 PM - 5:30 PM",
-            "max_participants": 15,
-            "participants": ["sara@mergington.edu"]
-        },
-        "Basketball Team": {
-            "description": "Competitive basketball training and games",
-            "schedule": "Mondays and Thursdays, 4:00 PM - 5:30 PM",
-            "max_participants": 14,
-            "participants": ["marcus@mergington.edu", "jessica@mergington.edu"]
-        },
-        "Soccer Team": {
-            "description": "Competitive soccer training and matches",
-            "schedule": "Tuesdays and Thursdays, 4:00 PM - 5:30 PM",
-            "max_participants": 16,
-            "participants": ["chris@mergington.edu"]
-        },
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        }
-    }
-    
-    # Reset to original state
-    activities.clear()
-    activities.update(original_activities)
-    yield
-    # Clean up after test
-    activities.clear()
-    activities.update(original_activities)
+def _participants(activity_name):
+    """Return the current participants list for an activity"""
+    return activities[activity_name]["participants"]
+
+
+@pytest.fixture
+def enrolled_student(client, reset_activities):
+    """Sign up a student and return the (activity, email) pair"""
+    activity, email = "Drama Club", "test@mergington.edu"
+    response = client.post(f"/activities/{activity}/signup?email={email}")
+    assert response.status_code == 200
+    return activity, email
 
 
 class TestRootEndpoint:
@@ -102,19 +43,16 @@ class TestRootEndpoint:
 class TestGetActivities:
     """Tests for GET /activities endpoint"""
     
-    def test_get_activities_returns_all_activities(self, client):
-        """Test that all activities are returned"""
+    def test_get_activities_returns_all_activities(self, client, expected_activities_bytes):
+        """Test that all activities are returned with their initial data"""
         response = client.get("/activities")
         assert response.status_code == 200
-        data = response.json()
-        assert len(data) == 9
-        assert "Drama Club" in data
-        assert "Programming Class" in data
+        assert orjson.loads(response.content) == orjson.loads(expected_activities_bytes)
     
-    def test_get_activities_structure(self, client):
+    def test_get_activities_structure(self, expected_activities_bytes):
         """Test that activity structure is correct"""
-        response = client.get("/activities")
-        data = response.json()
+        # The payload equals these bytes, as checked above, so no request is needed
+        data = orjson.loads(expected_activities_bytes)
         
         drama_club = data["Drama Club"]
         assert "description" in drama_club
@@ -127,76 +65,80 @@ class TestGetActivities:
 class TestSignupForActivity:
     """Tests for POST /activities/{activity_name}/signup endpoint"""
     
-    def test_signup_successful(self, client):
-        """Test successful signup for an activity"""
-        response = client.post(
-            "/activities/Drama Club/signup?email=newstudent@mergington.edu"
-        )
+    @pytest.mark.usefixtures("reset_activities")
+    @pytest.mark.parametrize("url_name, activity_name, email", [
+        ("Drama Club", "Drama Club", "newstudent@mergington.edu"),
+        ("Programming%20Class", "Programming Class", "newcoder@mergington.edu")
+    ], ids=["plain_name", "url_encoded_name"])
+    def test_signup_successful(self, client, url_name, activity_name, email):
+        """Test signup by plain and URL-encoded activity name"""
+        response = client.post(f"/activities/{url_name}/signup?email={email}")
         assert response.status_code == 200
-        data = response.json()
-        assert "Signed up newstudent@mergington.edu for Drama Club" in data["message"]
+        assert f"Signed up {email} for {activity_name}" in response.json()["message"]
         
         # Verify the student was added
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "newstudent@mergington.edu" in activities_data["Drama Club"]["participants"]
-    
-    def test_signup_duplicate_student(self, client):
-        """Test that duplicate signup is prevented"""
-        # First signup
-        client.post("/activities/Drama Club/signup?email=test@mergington.edu")
-        
-        # Try to signup again
-        response = client.post(
-            "/activities/Drama Club/signup?email=test@mergington.edu"
-        )
-        assert response.status_code == 400
-        assert "already signed up" in response.json()["detail"]
+        assert email in _participants(activity_name)
     
-    def test_signup_nonexistent_activity(self, client):
+    @pytest.mark.parametrize("url_name", [
+        "Nonexistent Club",
+        "Nonexistent%20Club"
+    ], ids=["plain_name", "url_encoded_name"])
+    def test_signup_nonexistent_activity(self, client, url_name):
         """Test signup for non-existent activity"""
-        response = client.post(
-            "/activities/Nonexistent Club/signup?email=test@mergington.edu"
-        )
+        response = client.post(f"/activities/{url_name}/signup?email=test@mergington.edu")
         assert response.status_code == 404
         assert "Activity not found" in response.json()["detail"]
     
-    def test_signup_url_encoded_activity_name(self, client):
-        """Test signup with URL-encoded activity name"""
-        response = client.post(
-            "/activities/Programming%20Class/signup?email=newcoder@mergington.edu"
-        )
+    @pytest.mark.usefixtures("reset_activities")
+    @pytest.mark.parametrize("student", [
+        "student1@mergington.edu",
+        "student2@mergington.edu",
+        "student3@mergington.edu"
+    ])
+    def test_single_student_signup(self, client, student):
+        """Test each student can sign up for the activity on their own"""
+        response = client.post(f"/activities/Soccer Team/signup?email={student}")
         assert response.status_code == 200
+        assert student in _participants("Soccer Team")
+    
+    def test_signup_duplicate_student(self, client, enrolled_student):
+        """Test that duplicate signup is prevented"""
+        activity, email = enrolled_student
         
-        # Verify the student was added
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "newcoder@mergington.edu" in activities_data["Programming Class"]["participants"]
+        # Try to signup again
+        response = client.post(f"/activities/{activity}/signup?email={email}")
+        assert response.status_code == 400
+        assert "already signed up" in response.json()["detail"]
 
 
 class TestUnregisterFromActivity:
     """Tests for DELETE /activities/{activity_name}/unregister endpoint"""
     
-    def test_unregister_successful(self, client):
-        """Test successful unregistration from an activity"""
-        # First verify the participant exists
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "alex@mergington.edu" in activities_data["Drama Club"]["participants"]
-        
-        # Unregister the participant
-        response = client.delete(
-            "/activities/Drama Club/unregister?email=alex@mergington.edu"
-        )
+    @pytest.mark.usefixtures("reset_activities")
+    @pytest.mark.parametrize("url_name, activity_name, email", [
+        ("Drama Club", "Drama Club", "alex@mergington.edu"),
+        ("Programming%20Class", "Programming Class", "emma@mergington.edu")
+    ], ids=["plain_name", "url_encoded_name"])
+    def test_unregister_successful(self, client, url_name, activity_name, email):
+        """Test unregister by plain and URL-encoded activity name"""
+        response = client.delete(f"/activities/{url_name}/unregister?email={email}")
         assert response.status_code == 200
-        data = response.json()
-        assert "Unregistered alex@mergington.edu from Drama Club" in data["message"]
+        assert f"Unregistered {email} from {activity_name}" in response.json()["message"]
         
         # Verify the participant was removed
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "alex@mergington.edu" not in activities_data["Drama Club"]["participants"]
+        assert email not in _participants(activity_name)
     
+    @pytest.mark.parametrize("url_name", [
+        "Nonexistent Club",
+        "Nonexistent%20Club"
+    ], ids=["plain_name", "url_encoded_name"])
+    def test_unregister_nonexistent_activity(self, client, url_name):
+        """Test unregistering from non-existent activity"""
+        response = client.delete(f"/activities/{url_name}/unregister?email=test@mergington.edu")
+        assert response.status_code == 404
+        assert "Activity not found" in response.json()["detail"]
+    
+    @pytest.mark.usefixtures("reset_activities")
     def test_unregister_not_registered_student(self, client):
         """Test unregistering a student who is not registered"""
         response = client.delete(
@@ -204,27 +146,9 @@ class TestUnregisterFromActivity:
         )
         assert response.status_code == 400
         assert "not registered" in response.json()["detail"]
-    
-    def test_unregister_nonexistent_activity(self, client):
-        """Test unregistering from non-existent activity"""
-        response = client.delete(
-            "/activities/Nonexistent Club/unregister?email=test@mergington.edu"
-        )
-        assert response.status_code == 404
-        assert "Activity not found" in response.json()["detail"]
-    
-    def test_unregister_url_encoded_activity_name(self, client):
-        """Test unregister with URL-encoded activity name"""
-        # First signup a student
-        client.post("/activities/Programming Class/signup?email=temp@mergington.edu")
-        
-        # Unregister with encoded name
-        response = client.delete(
-            "/activities/Programming%20Class/unregister?email=temp@mergington.edu"
-        )
-        assert response.status_code == 200
 
 
+@pytest.mark.usefixtures("reset_activities")
 class TestIntegrationScenarios:
     """Integration tests for complete workflows"""
     
@@ -232,33 +156,30 @@ class TestIntegrationScenarios:
         """Test complete signup and unregister workflow"""
         email = "workflow@mergington.edu"
         activity = "Chess Club"
+        signup_url = f"/activities/{activity}/signup?email={email}"
+        unregister_url = f"/activities/{activity}/unregister?email={email}"
         
         # Get initial participant count
-        initial_response = client.get("/activities")
-        initial_count = len(initial_response.json()[activity]["participants"])
+        initial_count = len(_participants(activity))
         
         # Signup
-        signup_response = client.post(f"/activities/{activity}/signup?email={email}")
+        signup_response = client.post(signup_url)
         assert signup_response.status_code == 200
         
         # Verify participant was added
-        after_signup = client.get("/activities")
-        after_signup_count = len(after_signup.json()[activity]["participants"])
-        assert after_signup_count == initial_count + 1
-        assert email in after_signup.json()[activity]["participants"]
+        assert len(_participants(activity)) == initial_count + 1
+        assert email in _participants(activity)
         
         # Unregister
-        unregister_response = client.delete(f"/activities/{activity}/unregister?email={email}")
+        unregister_response = client.delete(unregister_url)
         assert unregister_response.status_code == 200
         
         # Verify participant was removed
-        after_unregister = client.get("/activities")
-        after_unregister_count = len(after_unregister.json()[activity]["participants"])
-        assert after_unregister_count == initial_count
-        assert email not in after_unregister.json()[activity]["participants"]
+        assert len(_participants(activity)) == initial_count
+        assert email not in _participants(activity)
     
     def test_multiple_students_signup(self, client):
-        """Test multiple students signing up for the same activity"""
+        """Test that several signups to the same activity all persist"""
         activity = "Soccer Team"
         students = [
             "student1@mergington.edu",
@@ -266,12 +187,13 @@ class TestIntegrationScenarios:
             "student3@mergington.edu"
         ]
         
-        for student in students:
-            response = client.post(f"/activities/{activity}/signup?email={student}")
+        urls = [f"/activities/{activity}/signup?email={student}" for student in students]
+        
+        for url in urls:
+            response = client.post(url)
             assert response.status_code == 200
         
         # Verify all students are registered
-        activities_response = client.get("/activities")
-        participants = activities_response.json()[activity]["participants"]
+        participants = _participants(activity)
         for student in students:
             assert student in participants